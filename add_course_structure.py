@@ -94,5 +94,5 @@ def add_structure_to_course(filename):
 
 if __name__ == '__main__':
     for filename in os.listdir(COURSES_DIR):
-        if filename.endswith('-progressive.html') and filename != 'pt-msk-001-progressive.html':
+        if filename.endswith('-progressive.html'):
             add_structure_to_course(filename)
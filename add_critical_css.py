@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Inline critical CSS and add preload hints to progressive course pages
+Keeps the header, progress bar and first-module rules inline, defers the rest
+to courses/css/<page>.css and preloads first-module images and course scripts.
+
+Usage: python3 add_critical_css.py [SITE_DIR]   (defaults to dist/)
+"""
+import re
+import os
+import sys
+
+SITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dist')
+
+CSS_SUBDIR = 'css'
+
+# Classes the course runtime adds after load; rules using them still affect first paint
+RUNTIME_CLASSES = {'active', 'completed', 'locked', 'open', 'show', 'visible', 'done'}
+
+# At-rules that are small and referenced from critical rules; always kept inline
+INLINE_AT_RULES = ('@import', '@charset', '@font-face', '@keyframes', '@-webkit-keyframes')
+
+# Start of the second module marks the end of the above-the-fold fragment
+SECOND_MODULE_RE = re.compile(r'<div[^>]*(?:data-module="2"|id="module-2")')
+STYLE_RE = re.compile(r'<style>(.*?)</style>', re.S)
+CLASS_ATTR_RE = re.compile(r'class="([^"]*)"')
+ID_ATTR_RE = re.compile(r'id="([^"]*)"')
+IMG_SRC_RE = re.compile(r'<img[^>]*\ssrc="([^"]+)"')
+SCRIPT_TAG_RE = re.compile(r'<script[^>]*\ssrc="([^"]+)"[^>]*>')
+CROSSORIGIN_RE = re.compile(r'\scrossorigin(?:="[^"]*")?')
+
+
+def split_css_blocks(css):
+    """Split a stylesheet into top-level (prelude, body) pairs, keeping nesting intact"""
+    blocks = []
+    pos = 0
+    length = len(css)
+    while pos < length:
+        # Skip whitespace and comments
+        while pos < length and css[pos].isspace():
+            pos += 1
+        if css.startswith('/*', pos):
+            end = css.find('*/', pos + 2)
+            pos = length if end == -1 else end + 2
+            continue
+        if pos >= length:
+            break
+
+        start = pos
+        while pos < length and css[pos] not in '{;':
+            pos += 1
+        prelude = css[start:pos].strip()
+        if pos >= length:
+            break
+        if css[pos] == ';':
+            # Statement at-rule such as @import
+            blocks.append((prelude, None))
+            pos += 1
+            continue
+
+        depth = 0
+        body_start = pos + 1
+        while pos < length:
+            if css[pos] == '{':
+                depth += 1
+            elif css[pos] == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+            pos += 1
+        blocks.append((prelude, css[body_start:pos]))
+        pos += 1
+    return blocks
+
+
+def join_css_blocks(blocks, indent='        '):
+    lines = []
+    for prelude, body in blocks:
+        if body is None:
+            lines.append(f'{indent}{prelude};')
+        else:
+            lines.append(f'{indent}{prelude} {{{body}}}')
+    return '\n'.join(lines)
+
+
+def selector_is_critical(selector, classes, ids):
+    """A selector is critical when every class and id it needs is above the fold"""
+    # Arguments of :not()/:is() etc. do not have to be present
+    selector = re.sub(r':[\w-]+\([^)]*\)', '', selector)
+    selector = re.sub(r'\[[^\]]*\]', '', selector)
+    needed_classes = set(re.findall(r'\.([\w-]+)', selector))
+    needed_ids = set(re.findall(r'#([\w-]+)', selector))
+    return needed_classes <= (classes | RUNTIME_CLASSES) and needed_ids <= ids
+
+
+def partition_css(css, classes, ids):
+    """Split CSS into (critical, deferred) block lists"""
+    critical = []
+    deferred = []
+    for prelude, body in split_css_blocks(css):
+        lowered = prelude.lower()
+        if lowered.startswith(INLINE_AT_RULES):
+            critical.append((prelude, body))
+        elif lowered.startswith(('@media', '@supports')):
+            if lowered.startswith('@media') and 'print' in lowered and 'screen' not in lowered:
+                deferred.append((prelude, body))
+                continue
+            inner_critical, inner_deferred = partition_css(body, classes, ids)
+            if inner_critical:
+                critical.append((prelude, '\n' + join_css_blocks(inner_critical, '            ') + '\n        '))
+            if inner_deferred:
+                deferred.append((prelude, '\n' + join_css_blocks(inner_deferred, '            ') + '\n        '))
+        elif lowered.startswith('@'):
+            # @page only applies when printing
+            deferred.append((prelude, body))
+        elif any(selector_is_critical(s, classes, ids) for s in prelude.split(',')):
+            critical.append((prelude, body))
+        else:
+            deferred.append((prelude, body))
+    return critical, deferred
+
+
+def above_the_fold(content):
+    """Return the body markup up to the start of the second module"""
+    body_start = content.find('<body')
+    if body_start == -1:
+        return ''
+    match = SECOND_MODULE_RE.search(content, body_start)
+    end = match.start() if match else len(content)
+    return content[body_start:end]
+
+
+def local_file_exists(courses_dir, src):
+    """True for remote URLs and for relative paths that resolve to a file"""
+    if src.startswith(('http://', 'https://', '//')):
+        return True
+    path = src.split('#', 1)[0].split('?', 1)[0]
+    return os.path.isfile(os.path.normpath(os.path.join(courses_dir, path)))
+
+
+def preload_tags(courses_dir, head, fragment):
+    """Build preload hints for first-module images and the <head> runtime scripts"""
+    tags = []
+    seen = set()
+    for src in IMG_SRC_RE.findall(fragment):
+        # A 404 preload would sit first in line for first paint
+        if src.startswith('data:') or src in seen or not local_file_exists(courses_dir, src):
+            continue
+        seen.add(src)
+        tags.append(f'<link rel="preload" href="{src}" as="image">')
+    for match in SCRIPT_TAG_RE.finditer(head):
+        src = match.group(1)
+        if src in seen:
+            continue
+        seen.add(src)
+        # The preload is only reused if its CORS mode matches the <script> tag
+        crossorigin = CROSSORIGIN_RE.search(match.group(0))
+        crossorigin = crossorigin.group(0) if crossorigin else ''
+        tags.append(f'<link rel="preload" href="{src}" as="script"{crossorigin}>')
+    return tags
+
+
+def add_critical_css(courses_dir, filename):
+    """Inline critical CSS and add preload hints to a progressive course page"""
+    filepath = os.path.join(courses_dir, filename)
+
+    with open(filepath, 'r') as f:
+        content = f.read()
+
+    if 'data-critical' in content:
+        print(f"Already has critical CSS: {filename}")
+        return
+
+    head_end = content.find('</head>')
+    match = STYLE_RE.search(content, 0, head_end) if head_end != -1 else None
+    if not match:
+        print(f"No head stylesheet found in {filename}")
+        return
+
+    fragment = above_the_fold(content)
+    classes = set()
+    for attr in CLASS_ATTR_RE.findall(fragment):
+        classes.update(attr.split())
+    ids = set(ID_ATTR_RE.findall(fragment))
+
+    critical, deferred = partition_css(match.group(1), classes, ids)
+
+    if deferred:
+        css_name = filename.replace('.html', '.css')
+        css_dir = os.path.join(courses_dir, CSS_SUBDIR)
+        os.makedirs(css_dir, exist_ok=True)
+        with open(os.path.join(css_dir, css_name), 'w') as f:
+            f.write(join_css_blocks(deferred, '') + '\n')
+        href = f'{CSS_SUBDIR}/{css_name}'
+        stylesheet = (
+            f'<style data-critical>\n{join_css_blocks(critical)}\n    </style>\n'
+            f'    <link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+            f'    <noscript><link rel="stylesheet" href="{href}"></noscript>'
+        )
+    else:
+        stylesheet = f'<style data-critical>{match.group(1)}</style>'
+
+    content = content[:match.start()] + stylesheet + content[match.end():]
+
+    # Preload hints go right after the meta tags so the scanner sees them before the CSS
+    hints = preload_tags(courses_dir, content[:content.find('</head>')], fragment)
+    if hints:
+        anchor = content.find('<meta name="viewport"')
+        if anchor == -1:
+            anchor = content.find('<head>')
+        insert_at = content.find('\n', anchor) + 1
+        content = content[:insert_at] + ''.join(f'    {tag}\n' for tag in hints) + content[insert_at:]
+
+    with open(filepath, 'w') as f:
+        f.write(content)
+
+    print(f"✓ Inlined {len(critical)} critical / deferred {len(deferred)} rules in {filename}")
+
+
+if __name__ == '__main__':
+    site_dir = sys.argv[1] if len(sys.argv) > 1 else SITE_DIR
+    courses_dir = os.path.join(site_dir, 'courses')
+    for filename in sorted(os.listdir(courses_dir)):
+        if filename.endswith('-progressive.html'):
+            add_critical_css(courses_dir, filename)
+    print("\nDone! Progressive pages now inline critical CSS.")
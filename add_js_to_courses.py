@@ -126,10 +126,6 @@ def add_js_to_course(filename):
     course_id = filename.replace('-progressive.html', '')
     filepath = os.path.join(COURSES_DIR, filename)
     
-    if course_id == 'pt-msk-001':
-        print(f"Skipping {filename} - already has full JS")
-        return
-    
     with open(filepath, 'r') as f:
         content = f.read()
     
@@ -1,10 +1,12 @@
 #!/usr/bin/env node
 /**
  * DrTroy CE Platform — Build Script (Simple Copy Version)
- * Copies files to dist/ for deploy.
+ * Copies files to dist/ for deploy, then runs the course pipeline stages on it.
+ * Netlify runs this (netlify.toml) and publishes dist/.
  */
 const fs   = require('fs');
 const path = require('path');
+const { execFileSync } = require('child_process');
 
 const SRC  = __dirname;
 const DIST = path.join(__dirname, 'dist');
@@ -14,8 +16,18 @@ const SKIP = new Set([
   'node_modules', 'dist', '.git', 'build.js',
   'package.json', 'package-lock.json', 'validate-site.js',
   'CLAUDE.md', 'BANE-BRIEFING.md',
+  'add_critical_css.py', 'fingerprint_course_assets.py', 'course_asset_graph.py',
+  'compile_quizzes.py',
 ]);
 
+// Course pipeline stages, run in order against dist/
+const STAGES = [
+  ['compile_quizzes.py'],             // before pruning, which drops the quiz sources
+  ['course_asset_graph.py', '--prune'],
+  ['add_critical_css.py'],
+  ['fingerprint_course_assets.py'],   // must run last: rewrites every asset reference
+];
+
 // ─────────────────────────────────────────────────────────────────────────────
 // UTILITIES
 // ─────────────────────────────────────────────────────────────────────────────
@@ -68,5 +80,15 @@ async function walk(dir, callback) {
     }
   });
 
-  console.log(`\n✅  Build complete! ${stats.files} files copied.`);
+  for (const [stage, ...args] of STAGES) {
+    console.log(`\n⚙️   ${stage}`);
+    try {
+      execFileSync('python3', [path.join(SRC, stage), DIST, ...args], { stdio: 'inherit' });
+    } catch (err) {
+      console.error(`  ❌ ${stage}: ${err.message}`);
+      process.exit(1);
+    }
+  }
+
+  console.log(`\n✅  Build complete! ${stats.files} files copied, ${STAGES.length} stages run.`);
 })();
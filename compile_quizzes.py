@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Compile per-module quiz banks for every course
+Validates each courses/<prefix>_quiz_questions.json, writes one compact file per
+module to courses/quizzes/<course-id>/module<N>.json and adds the lazy loader
+(js/module-quiz-loader.js) to the course's progressive page.
+
+Usage: python3 compile_quizzes.py [SITE_DIR]   (defaults to dist/)
+"""
+import json
+import re
+import os
+import sys
+
+SITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dist')
+
+QUIZ_SUFFIX = '_quiz_questions.json'
+QUIZ_SUBDIR = 'quizzes'
+LOADER_SRC = '../js/module-quiz-loader.js'
+
+# Quiz bank prefixes that differ from the course ID
+QUIZ_COURSES = {
+    'msk': 'pt-msk-001',
+}
+
+# module1, module4_lumbar, ...
+MODULE_KEY_RE = re.compile(r'^module(\d+)(?:_\w+)?$')
+
+
+def validate_question(where, question):
+    """Return a list of problems with a single quiz question"""
+    if not isinstance(question, dict):
+        return [f"{where}: expected an object"]
+    errors = []
+    if not isinstance(question.get('question'), str) or not question['question'].strip():
+        errors.append(f"{where}: missing question text")
+    options = question.get('options')
+    if not isinstance(options, list) or len(options) < 2 or not all(isinstance(o, str) for o in options):
+        errors.append(f"{where}: options must be a list of at least 2 strings")
+        options = []
+    correct = question.get('correct')
+    if not isinstance(correct, int) or isinstance(correct, bool) or not 0 <= correct < len(options):
+        errors.append(f"{where}: correct must index into options")
+    if 'explanation' in question and not isinstance(question['explanation'], str):
+        errors.append(f"{where}: explanation must be a string")
+    return errors
+
+
+def compile_bank(source, bank):
+    """Validate a quiz bank and group its questions by module number"""
+    if not isinstance(bank, dict):
+        return {}, [f"{source}: expected an object keyed by module"]
+
+    modules = {}
+    errors = []
+    for key, questions in bank.items():
+        match = MODULE_KEY_RE.match(key)
+        if not match:
+            errors.append(f"{source}: unexpected key '{key}' (expected module<N>)")
+            continue
+        if not isinstance(questions, list) or not questions:
+            errors.append(f"{source}: {key} must be a non-empty list")
+            continue
+        for i, question in enumerate(questions):
+            problems = validate_question(f"{source}: {key}[{i}]", question)
+            errors.extend(problems)
+            if problems:
+                continue
+            # Same short keys as courseExamQuestions (add_js_to_courses.py)
+            compact = {'q': question['question'], 'o': question['options'], 'a': question['correct']}
+            if question.get('explanation'):
+                compact['e'] = question['explanation']
+            modules.setdefault(int(match.group(1)), []).append(compact)
+    return modules, errors
+
+
+def add_loader(courses_dir, course_id, module_numbers):
+    """Add the lazy quiz loader to the course's progressive page"""
+    filename = f'{course_id}-progressive.html'
+    filepath = os.path.join(courses_dir, filename)
+
+    with open(filepath, 'r') as f:
+        content = f.read()
+
+    if 'module-quiz-loader.js' in content:
+        print(f"  Already has quiz loader: {filename}")
+        return
+
+    # Must come after the page script that defines toggleModule()
+    body_end = content.rfind('</body>')
+    if body_end == -1:
+        print(f"  No </body> found in {filename}")
+        return
+
+    modules = ','.join(str(n) for n in module_numbers)
+    tag = f'<script src="{LOADER_SRC}" data-course-id="{course_id}" data-quiz-modules="{modules}"></script>\n'
+    content = content[:body_end] + tag + content[body_end:]
+
+    with open(filepath, 'w') as f:
+        f.write(content)
+
+    print(f"  ✓ Added quiz loader to {filename}")
+
+
+def compile_quizzes(site_dir):
+    courses_dir = os.path.join(site_dir, 'courses')
+    errors = []
+
+    for source in sorted(os.listdir(courses_dir)):
+        if not source.endswith(QUIZ_SUFFIX):
+            continue
+        prefix = source[:-len(QUIZ_SUFFIX)]
+        course_id = QUIZ_COURSES.get(prefix, prefix)
+        if not os.path.isfile(os.path.join(courses_dir, f'{course_id}-progressive.html')):
+            errors.append(f"{source}: no progressive page for course '{course_id}'")
+            continue
+
+        print(f"Compiling {source} → {course_id}")
+        try:
+            with open(os.path.join(courses_dir, source), 'r') as f:
+                bank = json.load(f)
+        except json.JSONDecodeError as e:
+            errors.append(f"{source}: invalid JSON ({e})")
+            continue
+
+        modules, bank_errors = compile_bank(source, bank)
+        if bank_errors:
+            errors.extend(bank_errors)
+            continue
+
+        out_dir = os.path.join(courses_dir, QUIZ_SUBDIR, course_id)
+        os.makedirs(out_dir, exist_ok=True)
+        for module_num, questions in sorted(modules.items()):
+            with open(os.path.join(out_dir, f'module{module_num}.json'), 'w') as f:
+                json.dump(questions, f, ensure_ascii=False, separators=(',', ':'))
+            print(f"  ✓ module{module_num}.json ({len(questions)} questions)")
+
+        add_loader(courses_dir, course_id, sorted(modules))
+
+    if errors:
+        print("\nQuiz validation failed:")
+        for error in errors:
+            print(f"  ✗ {error}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    compile_quizzes(sys.argv[1] if len(sys.argv) > 1 else SITE_DIR)
+    print("\nDone! Quiz banks compiled.")
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Build the course asset reference graph and find dead course assets
+Scans every HTML/JS/CSS file of the site in parallel, maps each page to the
+local files it references, then reports broken references from course pages
+and course assets (courses/images/, loose files in courses/) nobody references.
+
+Usage: python3 course_asset_graph.py [SITE_DIR] [--prune]
+  SITE_DIR defaults to the repository itself (report only).
+  --prune deletes the unreferenced course assets; build.js runs it on dist/.
+  It refuses to run on the source tree.
+"""
+import re
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+SITE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SKIP_DIRS = {'node_modules', 'dist', '.git', '__pycache__'}
+SCANNED_EXTENSIONS = {'.html', '.js', '.css'}
+ASSET_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.ico', '.pdf',
+                    '.js', '.css', '.json', '.mp4', '.webm')
+
+SITE_ORIGIN_RE = re.compile(r'^https?://(?:www\.)?drtroy\.com(?=/)')
+ATTR_REF_RE = re.compile(r'\s(?:src|href|poster|data-src)="([^"]+)"')
+CSS_URL_RE = re.compile(r'url\(\s*[\'"]?([^\'")]+)[\'"]?\s*\)')
+# Paths built in scripts, e.g. img.src = 'images/foo.svg'
+LITERAL_REF_RE = re.compile(r'[\'"`]((?:\.\./|\./)?[\w./-]+(?:%s))(?:\?[^\'"`]*)?[\'"`]'
+                            % '|'.join(re.escape(ext) for ext in ASSET_EXTENSIONS))
+# Absolute links to our own origin, e.g. og:image meta tags
+SITE_URL_RE = re.compile(r'https?://(?:www\.)?drtroy\.com/[\w./-]+')
+
+
+def resolve(site_dir, base_dir, url):
+    """Map a reference to a path inside the site, or None for external URLs"""
+    url = SITE_ORIGIN_RE.sub('', url.strip())
+    if url.startswith(('http://', 'https://', '//', 'data:', 'mailto:', 'tel:', 'javascript:', '#', '$', '{')):
+        return None
+    path = url.split('#', 1)[0].split('?', 1)[0]
+    if not path:
+        return None
+    if path.startswith('/'):
+        return os.path.normpath(os.path.join(site_dir, path.lstrip('/')))
+    return os.path.normpath(os.path.join(base_dir, path))
+
+
+def exists(target):
+    # Netlify serves /foo from foo.html and /dir/ from dir/index.html
+    return (os.path.isfile(target) or os.path.isfile(target + '.html')
+            or os.path.isfile(os.path.join(target, 'index.html')))
+
+
+def scan_file(args):
+    """Return (page, [(url, target, strict)]) for one file; strict refs are checked for breakage"""
+    site_dir, filepath = args
+    with open(filepath, 'r', errors='ignore') as f:
+        content = f.read()
+    base_dir = os.path.dirname(filepath)
+
+    refs = []
+    for pattern, strict in ((ATTR_REF_RE, True), (CSS_URL_RE, True), (LITERAL_REF_RE, False), (SITE_URL_RE, False)):
+        for url in pattern.findall(content):
+            target = resolve(site_dir, base_dir, url)
+            if target:
+                refs.append((url, target, strict))
+    return filepath, refs
+
+
+def site_files(site_dir):
+    for root, dirs, files in os.walk(site_dir):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            yield os.path.join(root, name)
+
+
+def course_assets(courses_dir):
+    """Files that are only ever served as course assets"""
+    assets = set()
+    for name in os.listdir(courses_dir):
+        path = os.path.join(courses_dir, name)
+        if os.path.isfile(path) and not name.endswith('.html'):
+            assets.add(path)
+    images_dir = os.path.join(courses_dir, 'images')
+    for root, dirs, files in os.walk(images_dir):
+        assets.update(os.path.join(root, name) for name in files)
+    return assets
+
+
+def build_graph(site_dir, courses_dir):
+    """Map every scanned page to the set of site paths it references"""
+    # Saved pages under courses/images/ are assets themselves, not referrers
+    images_dir = os.path.join(courses_dir, 'images') + os.sep
+    pages = [p for p in site_files(site_dir)
+             if os.path.splitext(p)[1].lower() in SCANNED_EXTENSIONS and not p.startswith(images_dir)]
+    with ProcessPoolExecutor() as pool:
+        results = pool.map(scan_file, [(site_dir, p) for p in pages], chunksize=16)
+        return dict(results)
+
+
+def is_source_tree(site_dir):
+    return (os.path.realpath(site_dir) == os.path.realpath(SITE_DIR)
+            or os.path.exists(os.path.join(site_dir, '.git')))
+
+
+def report(site_dir, prune=False):
+    site_dir = os.path.abspath(site_dir)
+    if prune and is_source_tree(site_dir):
+        print(f"Refusing to prune the source tree ({site_dir}); pass a build output such as dist/")
+        sys.exit(1)
+    courses_dir = os.path.join(site_dir, 'courses')
+    graph = build_graph(site_dir, courses_dir)
+
+    referenced = set()
+    broken = []
+    for page, refs in sorted(graph.items()):
+        for url, target, strict in refs:
+            referenced.add(target)
+            if strict and os.path.dirname(page) == courses_dir and not exists(target):
+                broken.append((os.path.relpath(page, site_dir), url))
+
+    unreferenced = sorted(course_assets(courses_dir) - referenced)
+    dead_bytes = sum(os.path.getsize(p) for p in unreferenced)
+
+    print(f"Scanned {len(graph)} files, {sum(len(r) for r in graph.values())} references")
+
+    print(f"\nBroken references from course pages: {len(broken)}")
+    for page, url in broken:
+        print(f"  ✗ {page} → {url}")
+
+    print(f"\nUnreferenced course assets: {len(unreferenced)} ({dead_bytes / 1024 / 1024:.1f} MB)")
+    for path in unreferenced:
+        print(f"  - {os.path.relpath(path, site_dir)}")
+
+    if prune:
+        for path in unreferenced:
+            os.remove(path)
+        print(f"\n✓ Pruned {len(unreferenced)} files ({dead_bytes / 1024 / 1024:.1f} MB)")
+
+    return broken, unreferenced
+
+
+if __name__ == '__main__':
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    report(args[0] if args else SITE_DIR, prune='--prune' in sys.argv)
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Fingerprint course assets and generate matching cache rules in _headers
+Copies every image, script and stylesheet referenced by the course pages to
+courses/static/<name>.<hash>.<ext>, rewrites the references and regenerates
+the /courses cache rules: immutable for hashed assets, short TTLs for HTML.
+
+Usage: python3 fingerprint_course_assets.py [SITE_DIR]   (defaults to dist/)
+"""
+import hashlib
+import re
+import os
+import sys
+
+SITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dist')
+
+STATIC_SUBDIR = 'static'
+QUIZ_SUBDIR = 'quizzes'   # compile_quizzes.py output, fetched by name
+HASH_LENGTH = 10
+
+ASSET_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.js', '.css'}
+
+# Stylesheets may reference images, so they are hashed after everything else
+LEAF_EXTENSIONS = ASSET_EXTENSIONS - {'.css'}
+
+HASHED_CACHE_CONTROL = 'private, max-age=31536000, immutable'
+HTML_CACHE_CONTROL = 'private, max-age=300, must-revalidate'
+# Everything else under /courses keeps the policy /courses/* had before
+COURSES_CACHE_CONTROL = 'private, no-cache'
+
+HEADERS_BEGIN = '# BEGIN course asset cache rules (generated by fingerprint_course_assets.py)'
+HEADERS_END = '# END course asset cache rules'
+
+ATTR_REF_RE = re.compile(r'(\s(?:src|href)=")([^"]+)(")')
+CSS_URL_RE = re.compile(r'(url\(\s*[\'"]?)([^\'")]+)([\'"]?\s*\))')
+
+
+def is_local(url):
+    return not (url.startswith(('http://', 'https://', '//', 'data:', 'mailto:', '#', '/')))
+
+
+def local_target(base_dir, url):
+    """Path a relative reference points at, whether or not it exists"""
+    if not is_local(url):
+        return None
+    path = url.split('#', 1)[0].split('?', 1)[0]
+    return os.path.normpath(os.path.join(base_dir, path)) if path else None
+
+
+def resolve(site_dir, base_dir, url):
+    """Resolve a relative reference to an existing asset inside the site, or None"""
+    target = local_target(base_dir, url)
+    if not target or not target.startswith(site_dir + os.sep) or not os.path.isfile(target):
+        return None
+    if os.path.splitext(target)[1].lower() not in ASSET_EXTENSIONS:
+        return None
+    return target
+
+
+def hashed_name(filepath):
+    with open(filepath, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:HASH_LENGTH]
+    stem, ext = os.path.splitext(os.path.basename(filepath))
+    return f'{stem}.{digest}{ext}'
+
+
+def rewrite_references(text, pattern, site_dir, base_dir, hashed):
+    """Point every reference to a fingerprinted asset at its hashed copy"""
+    def replace(match):
+        # Look up the hashed map, not the filesystem: originals may already be gone
+        target = local_target(base_dir, match.group(2))
+        if target not in hashed:
+            return match.group(0)
+        new_url = os.path.relpath(hashed[target], base_dir).replace(os.sep, '/')
+        return match.group(1) + new_url + match.group(3)
+    return pattern.sub(replace, text)
+
+
+def collect_assets(site_dir, courses_dir, pages):
+    """Return every local asset referenced by the course pages and their stylesheets"""
+    assets = set()
+    for filename in pages:
+        with open(os.path.join(courses_dir, filename), 'r') as f:
+            content = f.read()
+        for _, url, _ in ATTR_REF_RE.findall(content):
+            target = resolve(site_dir, courses_dir, url)
+            if target:
+                assets.add(target)
+    for stylesheet in [a for a in assets if a.endswith('.css')]:
+        with open(stylesheet, 'r') as f:
+            css = f.read()
+        for _, url, _ in CSS_URL_RE.findall(css):
+            target = resolve(site_dir, os.path.dirname(stylesheet), url)
+            if target:
+                assets.add(target)
+    return assets
+
+
+def site_text_outside(site_dir, courses_dir):
+    """Concatenated HTML/JS/CSS outside courses/, used to spot shared assets"""
+    chunks = []
+    for root, dirs, files in os.walk(site_dir):
+        if root == courses_dir or root.startswith(courses_dir + os.sep):
+            continue
+        for name in files:
+            if os.path.splitext(name)[1].lower() in ('.html', '.js', '.css'):
+                with open(os.path.join(root, name), 'r', errors='ignore') as f:
+                    chunks.append(f.read())
+    return '\n'.join(chunks)
+
+
+def fingerprint(site_dir, asset, static_dir, hashed):
+    """Copy an asset to its content-hashed name"""
+    if asset.endswith('.css'):
+        with open(asset, 'r') as f:
+            css = f.read()
+        css = rewrite_references(css, CSS_URL_RE, site_dir, os.path.dirname(asset), hashed)
+        with open(asset, 'w') as f:
+            f.write(css)
+
+    target = os.path.join(static_dir, hashed_name(asset))
+    with open(asset, 'rb') as src, open(target, 'wb') as dest:
+        dest.write(src.read())
+    hashed[asset] = target
+
+
+def remove_originals(site_dir, courses_dir, hashed):
+    """Delete course-only originals once every reference points at the hashed copy"""
+    # Shared assets (../js/..., site-wide logos) are still used by other pages
+    shared_text = site_text_outside(site_dir, courses_dir)
+    for asset in hashed:
+        site_path = os.path.relpath(asset, site_dir).replace(os.sep, '/')
+        if asset.startswith(courses_dir + os.sep) and site_path not in shared_text:
+            os.remove(asset)
+
+    # e.g. courses/css/ once its deferred stylesheets are all hashed
+    for root, dirs, files in os.walk(courses_dir, topdown=False):
+        if root != courses_dir and not os.listdir(root):
+            os.rmdir(root)
+
+
+def dangling_references(courses_dir, pages):
+    """Return (page, url) pairs whose local src/href target does not exist"""
+    dangling = set()
+    for filename in pages:
+        with open(os.path.join(courses_dir, filename), 'r') as f:
+            content = f.read()
+        for _, url, _ in ATTR_REF_RE.findall(content):
+            target = local_target(courses_dir, url)
+            if target and not os.path.exists(target) and not os.path.exists(target + '.html'):
+                dangling.add((filename, url))
+    return dangling
+
+
+def unhashed_paths(courses_dir):
+    """URL patterns for whatever is left under /courses besides pages and generated dirs"""
+    paths = []
+    for name in sorted(os.listdir(courses_dir)):
+        if name in (STATIC_SUBDIR, QUIZ_SUBDIR) or name.endswith('.html'):
+            continue
+        if os.path.isdir(os.path.join(courses_dir, name)):
+            paths.append(f'/courses/{name}/*')
+        else:
+            paths.append(f'/courses/{name}')
+    return paths
+
+
+def update_headers(site_dir, pages):
+    """Regenerate the /courses cache rules in _headers"""
+    headers_path = os.path.join(site_dir, '_headers')
+    with open(headers_path, 'r') as f:
+        headers = f.read()
+
+    if HEADERS_BEGIN in headers:
+        print("_headers already has course asset cache rules")
+        return
+
+    # /courses/* matches assets too, and Netlify would merge its Cache-Control
+    # with the rules below, so the per-type rules take over cache control
+    headers = re.sub(r'(/courses/\*\n(?:  .*\n?)*?)  Cache-Control: [^\n]*\n?', r'\1', headers)
+
+    lines = ['', HEADERS_BEGIN, f'/courses/{STATIC_SUBDIR}/*', f'  Cache-Control: {HASHED_CACHE_CONTROL}', '']
+    lines += [f'/courses/{QUIZ_SUBDIR}/*', f'  Cache-Control: {HTML_CACHE_CONTROL}', '']
+    for path in unhashed_paths(os.path.join(site_dir, 'courses')):
+        lines += [path, f'  Cache-Control: {COURSES_CACHE_CONTROL}', '']
+    for filename in pages:
+        lines.append(f'/courses/{filename}')
+        lines.append(f'  Cache-Control: {HTML_CACHE_CONTROL}')
+        lines.append('')
+    lines.append(HEADERS_END)
+
+    with open(headers_path, 'w') as f:
+        f.write(headers.rstrip('\n') + '\n' + '\n'.join(lines) + '\n')
+
+    print(f"✓ Wrote cache rules for {len(pages)} course pages to _headers")
+
+
+def fingerprint_course_assets(site_dir):
+    courses_dir = os.path.join(site_dir, 'courses')
+    static_dir = os.path.join(courses_dir, STATIC_SUBDIR)
+    pages = sorted(f for f in os.listdir(courses_dir) if f.endswith('.html'))
+
+    if os.path.isdir(static_dir):
+        print(f"Already fingerprinted: {static_dir}")
+        return
+    os.makedirs(static_dir)
+
+    already_dangling = dangling_references(courses_dir, pages)
+    assets = collect_assets(site_dir, courses_dir, pages)
+    hashed = {}
+    for asset in sorted(assets, key=lambda a: os.path.splitext(a)[1].lower() not in LEAF_EXTENSIONS):
+        fingerprint(site_dir, asset, static_dir, hashed)
+
+    for filename in pages:
+        filepath = os.path.join(courses_dir, filename)
+        with open(filepath, 'r') as f:
+            content = f.read()
+        content = rewrite_references(content, ATTR_REF_RE, site_dir, courses_dir, hashed)
+        with open(filepath, 'w') as f:
+            f.write(content)
+
+    remove_originals(site_dir, courses_dir, hashed)
+
+    # Broken links that predate this stage are reported by course_asset_graph.py
+    broken = sorted(dangling_references(courses_dir, pages) - already_dangling)
+    if broken:
+        print("\nFingerprinting left dangling references:")
+        for filename, url in broken:
+            print(f"  ✗ {filename} → {url}")
+        sys.exit(1)
+
+    print(f"✓ Fingerprinted {len(hashed)} assets across {len(pages)} course pages")
+    update_headers(site_dir, pages)
+
+
+if __name__ == '__main__':
+    site_dir = os.path.abspath(sys.argv[1] if len(sys.argv) > 1 else SITE_DIR)
+    fingerprint_course_assets(site_dir)
+    print("\nDone! Course assets are now content-hashed.")
@@ -0,0 +1,121 @@
+/**
+ * DrTroy CE Platform — Module Quiz Loader
+ * Fetches a module's compiled quiz bank (courses/quizzes/<course>/module<N>.json)
+ * the first time that module is opened and renders it as practice questions.
+ * Injected into progressive course pages by compile_quizzes.py.
+ */
+(function() {
+  'use strict';
+
+  const script = document.currentScript;
+  const COURSE_ID = script.dataset.courseId;
+  const QUIZ_MODULES = (script.dataset.quizModules || '').split(',').map(Number);
+  const QUIZ_BASE = 'quizzes/' + COURSE_ID + '/';
+
+  const loaded = {};
+
+  function moduleContent(moduleNum) {
+    const container = document.getElementById('module-' + moduleNum)
+      || document.querySelector('[data-module="' + moduleNum + '"]');
+    if (!container) return null;
+    return document.getElementById('content-' + moduleNum)
+      || container.querySelector('.module-content')
+      || container;
+  }
+
+  function escapeHtml(text) {
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+  }
+
+  function renderQuiz(moduleNum, questions) {
+    const content = moduleContent(moduleNum);
+    if (!content) return;
+
+    const quiz = document.createElement('div');
+    quiz.className = 'knowledge-check module-quiz';
+    quiz.id = 'module-quiz-' + moduleNum;
+
+    let html = '<h3>📝 Practice Questions - Module ' + moduleNum + '</h3>';
+    questions.forEach(function(question, i) {
+      const name = 'mq' + moduleNum + '-' + i;
+      html += '<div class="question">' + escapeHtml(question.q) + '</div><div class="answer-options">';
+      question.o.forEach(function(option, j) {
+        html += '<label class="answer-option"><input type="radio" name="' + name + '" value="' + j + '"> '
+          + String.fromCharCode(65 + j) + ') ' + escapeHtml(option) + '</label>';
+      });
+      html += '</div><button class="check-answer-btn" data-question="' + i + '">Check Answer</button>'
+        + '<div class="feedback" id="' + name + '-feedback"></div>';
+    });
+    quiz.innerHTML = html;
+
+    quiz.addEventListener('click', function(e) {
+      const btn = e.target.closest('.check-answer-btn');
+      if (btn) checkQuestion(moduleNum, questions, Number(btn.dataset.question));
+    });
+
+    // Practice questions sit above the gating knowledge check
+    const knowledgeCheck = content.querySelector('.knowledge-check');
+    content.insertBefore(quiz, knowledgeCheck);
+  }
+
+  function checkQuestion(moduleNum, questions, i) {
+    const name = 'mq' + moduleNum + '-' + i;
+    const selected = document.querySelector('input[name="' + name + '"]:checked');
+    const feedback = document.getElementById(name + '-feedback');
+    if (!selected) return;
+
+    const question = questions[i];
+    const correct = Number(selected.value) === question.a;
+    document.querySelectorAll('input[name="' + name + '"]').forEach(function(option) {
+      option.parentElement.classList.remove('correct', 'incorrect');
+      if (Number(option.value) === question.a) option.parentElement.classList.add('correct');
+      else if (option === selected) option.parentElement.classList.add('incorrect');
+    });
+
+    feedback.className = 'feedback ' + (correct ? 'correct' : 'incorrect');
+    feedback.textContent = (correct ? '✅ Correct. ' : '❌ Not quite. ') + (question.e || '');
+  }
+
+  function loadModuleQuiz(moduleNum) {
+    moduleNum = Number(moduleNum);
+    if (loaded[moduleNum] || !QUIZ_MODULES.includes(moduleNum)) return;
+    loaded[moduleNum] = true;
+
+    fetch(QUIZ_BASE + 'module' + moduleNum + '.json', { credentials: 'same-origin' })
+      .then(function(res) {
+        if (!res.ok) throw new Error('HTTP ' + res.status);
+        return res.json();
+      })
+      .then(function(questions) { renderQuiz(moduleNum, questions); })
+      .catch(function(err) {
+        loaded[moduleNum] = false;
+        console.warn('Failed to load quiz for module ' + moduleNum + ':', err.message);
+      });
+  }
+
+  // Course pages open modules through the global toggleModule()
+  const originalToggle = window.toggleModule;
+  if (typeof originalToggle === 'function') {
+    window.toggleModule = function(moduleNum) {
+      // Locked modules don't open, so their quiz bank isn't needed yet
+      const container = document.getElementById('module-' + moduleNum)
+        || document.querySelector('[data-module="' + moduleNum + '"]');
+      const header = container && container.querySelector('.module-header');
+      if (header && !header.classList.contains('locked')) loadModuleQuiz(moduleNum);
+      return originalToggle.apply(this, arguments);
+    };
+  }
+
+  // Modules already open on page load (first module, restored progress)
+  document.addEventListener('DOMContentLoaded', function() {
+    document.querySelectorAll('.module-content.active').forEach(function(content) {
+      const container = content.closest('[id^="module-"], [data-module]');
+      if (!container) return;
+      loadModuleQuiz(container.dataset.module || container.id.replace('module-', ''));
+    });
+  });
+
+  window.DrTroyModuleQuiz = { load: loadModuleQuiz };
+})();
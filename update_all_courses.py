@@ -227,11 +227,6 @@ def process_course_file(filename):
     course_id = filename.replace('-progressive.html', '')
     filepath = os.path.join(COURSES_DIR, filename)
     
-    # Skip MSK course (already has full structure)
-    if course_id == 'pt-msk-001':
-        print(f"Skipping {filename} - already has full structure")
-        return
-    
     # Get course data
     data = COURSE_DATA.get(course_id, {
         'title': course_id.replace('-', ' ').title(),
@@ -23,6 +23,7 @@ const jsFiles = [
     'js/supabase-client.js',
     'js/cart.js',
     'js/course-guard.js',
+    'js/module-quiz-loader.js',
 ];
 for (const f of jsFiles) {
     const full = path.join(__dirname, f);